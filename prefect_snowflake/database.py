@@ -1,7 +1,11 @@
 """Module for querying against Snowflake databases."""
 
 import asyncio
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+import queue
+import random
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type, Union
 
 from prefect import task
 from prefect.blocks.abstract import DatabaseBlock
@@ -10,12 +14,128 @@ from prefect.utilities.hashing import hash_objects
 from pydantic import Field
 from snowflake.connector.connection import SnowflakeConnection
 from snowflake.connector.cursor import SnowflakeCursor
+from snowflake.connector.errors import ProgrammingError
 
 from prefect_snowflake import SnowflakeCredentials
 
 BEGIN_TRANSACTION_STATEMENT = "BEGIN TRANSACTION"
 END_TRANSACTION_STATEMENT = "COMMIT"
 
+INITIAL_POLL_INTERVAL_SECONDS = 0.05
+
+POOL_BORROW_TIMEOUT_SECONDS = 300
+
+
+def _backoff_intervals(interval_seconds: float):
+    """
+    Yields sleep intervals that start at `INITIAL_POLL_INTERVAL_SECONDS` and
+    back off exponentially up to `interval_seconds`, so short queries are
+    noticed within milliseconds while long queries do not hammer the API.
+    Each interval carries +/-10% jitter so concurrently polled queries
+    do not check status in lockstep.
+
+    Args:
+        interval_seconds: The longest interval to sleep between checks.
+
+    Yields:
+        The number of seconds to sleep before the next status check.
+    """
+    interval = min(INITIAL_POLL_INTERVAL_SECONDS, interval_seconds)
+    while True:
+        yield interval * random.uniform(0.9, 1.1)
+        interval = min(interval * 1.5, interval_seconds)
+
+
+SERVER_SIDE_WAIT_STATEMENT = "SELECT SYSTEM$WAIT_FOR_QUERY_COMPLETION(%s, %s)"
+
+SERVER_SIDE_WAIT_TIMEOUT_SECONDS = 60
+
+
+async def _wait_for_query_completion(
+    connection: SnowflakeConnection,
+    cursor: SnowflakeCursor,
+    query_id: str,
+    interval_seconds: float,
+) -> None:
+    """
+    Waits until the query is no longer running. Prefers Snowflake's
+    server-side wait, which holds a single request open for up to
+    `SERVER_SIDE_WAIT_TIMEOUT_SECONDS` at a time instead of issuing one
+    status request per poll; the query status is only checked after the
+    wait returns. Accounts without the wait function fall back to
+    client-side status polling with exponentially backed off sleeps in
+    between.
+
+    Args:
+        connection: The connection the query was submitted through.
+        cursor: The cursor the query was submitted through; the wait
+            statement is issued on it before it is re-bound to the query's
+            results.
+        query_id: The `sfqid` of the submitted query.
+        interval_seconds: The longest interval to wait between checks when
+            falling back to client-side polling.
+
+    Raises:
+        snowflake.connector.errors.ProgrammingError: If the query failed.
+    """
+    use_server_side_wait = getattr(connection, "_server_side_wait_supported", True)
+    intervals = _backoff_intervals(interval_seconds)
+    while True:
+        if use_server_side_wait:
+            try:
+                await run_sync_in_worker_thread(
+                    cursor.execute,
+                    SERVER_SIDE_WAIT_STATEMENT,
+                    params=(query_id, SERVER_SIDE_WAIT_TIMEOUT_SECONDS),
+                )
+            except ProgrammingError:
+                # the wait function is unknown on this account;
+                # remember so subsequent queries skip the attempt
+                use_server_side_wait = False
+                connection._server_side_wait_supported = False
+        if not connection.is_still_running(
+            await run_sync_in_worker_thread(
+                connection.get_query_status_throw_if_error, query_id
+            )
+        ):
+            return
+        if not use_server_side_wait:
+            await asyncio.sleep(next(intervals))
+
+
+async def _execute_and_fetch_all(
+    connection: SnowflakeConnection,
+    cursor: SnowflakeCursor,
+    query: str,
+    params: Union[Tuple[Any], Dict[str, Any]],
+    poll_frequency_seconds: float,
+) -> List[Tuple[Any]]:
+    """
+    Submits the query asynchronously, waits until it completes, and
+    returns all of its rows; shared by the query tasks so the pooling,
+    waiting, and thread-offloading behavior stays in one place.
+
+    Args:
+        connection: The connection to submit the query through.
+        cursor: The cursor to submit the query through.
+        query: The query to execute against the database.
+        params: The params to replace the placeholders in the query.
+        poll_frequency_seconds: The longest interval to wait between
+            completion checks.
+
+    Returns:
+        The output of `cursor.fetchall()`.
+    """
+    response = await run_sync_in_worker_thread(
+        cursor.execute_async, query, params=params
+    )
+    query_id = response["queryId"]
+    await _wait_for_query_completion(
+        connection, cursor, query_id, poll_frequency_seconds
+    )
+    await run_sync_in_worker_thread(cursor.get_results_from_sfqid, query_id)
+    return await run_sync_in_worker_thread(cursor.fetchall)
+
 
 class SnowflakeConnector(DatabaseBlock):
 
@@ -40,6 +160,12 @@ class SnowflakeConnector(DatabaseBlock):
             this attribute is accessible through `SnowflakeConnector(...).schema_`.
         fetch_size: The number of rows to fetch at a time.
         poll_frequency_s: The number of seconds before checking query.
+        pool_size: The maximum number of connections to keep in the pool.
+        session_parameters: Session parameters applied at login time.
+        query_tag: The QUERY_TAG session parameter applied to every query.
+        use_numpy: Whether to decode numeric columns into numpy types.
+        arrow_number_to_decimal: Whether the columnar fetch methods decode
+            NUMBER columns as `decimal.Decimal` instead of `float64`.
 
     Examples:
         Load stored Snowflake connector as a context manager:
@@ -103,9 +229,75 @@ class SnowflakeConnector(DatabaseBlock):
             "status for long running queries."
         ),
     )
+    pool_size: int = Field(
+        default=4,
+        description=(
+            "The maximum number of connections to keep open "
+            "in the block's connection pool."
+        ),
+    )
+    session_parameters: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description=(
+            "Session parameters, e.g. TIMEZONE, applied as part of the "
+            "login request instead of a separate ALTER SESSION query."
+        ),
+    )
+    query_tag: Optional[str] = Field(
+        default=None,
+        description=(
+            "The QUERY_TAG session parameter applied to every query "
+            "run over the block's connections."
+        ),
+    )
+    use_numpy: bool = Field(
+        default=False,
+        description=(
+            "Whether the driver decodes numeric and timestamp columns "
+            "into numpy types instead of per-cell Python objects; much "
+            "faster for numeric-heavy result sets."
+        ),
+    )
+    arrow_number_to_decimal: bool = Field(
+        default=False,
+        description=(
+            "Whether `fetch_arrow` and `fetch_pandas` decode fixed-point "
+            "NUMBER columns as `decimal.Decimal` instead of `float64`; "
+            "exact, but far slower to construct."
+        ),
+    )
 
     _connection: Optional[SnowflakeConnection] = None
     _unique_cursors: Dict[str, SnowflakeCursor] = None
+    _statement_cursors: Dict[str, Tuple[SnowflakeCursor, Any]] = None
+    _pool: Optional[queue.Queue] = None
+    _pool_connections: int = 0
+    # guards the pool's lazy init and connection count; shared across
+    # instances, but only held for bookkeeping, never for the login itself
+    _pool_lock = threading.Lock()
+
+    def _connect_params(self) -> Dict[str, Any]:
+        """
+        Assembles the connect params derived from the block's fields.
+        """
+        connect_params = {
+            "database": self.database,
+            "warehouse": self.warehouse,
+            "schema": self.schema_,
+            # let pooled and persistent connections survive idle periods
+            # instead of paying a fresh login on the next query
+            "client_session_keep_alive": True,
+        }
+        session_parameters = dict(self.session_parameters or {})
+        if self.query_tag is not None:
+            session_parameters.setdefault("QUERY_TAG", self.query_tag)
+        if session_parameters:
+            connect_params["session_parameters"] = session_parameters
+        if self.use_numpy:
+            connect_params["numpy"] = True
+        if self.arrow_number_to_decimal:
+            connect_params["arrow_number_to_decimal"] = True
+        return connect_params
 
     def get_connection(self, **connect_kwargs: Dict[str, Any]) -> SnowflakeConnection:
         """
@@ -142,16 +334,180 @@ class SnowflakeConnector(DatabaseBlock):
         if self._connection is not None:
             return self._connection
 
-        connect_params = {
-            "database": self.database,
-            "warehouse": self.warehouse,
-            "schema": self.schema_,
-        }
-        connection = self.credentials.get_client(**connect_kwargs, **connect_params)
+        connection = self.credentials.get_client(
+            **connect_kwargs, **self._connect_params()
+        )
         self._connection = connection
         self.logger.info("Started a new connection to Snowflake.")
         return connection
 
+    def _borrow_connection(
+        self, **connect_kwargs: Dict[str, Any]
+    ) -> SnowflakeConnection:
+        """
+        Takes a connection from the pool, lazily opening
+        new connections up to `pool_size`.
+
+        Raises:
+            RuntimeError: If all the connections stayed borrowed for
+                `POOL_BORROW_TIMEOUT_SECONDS`.
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = queue.Queue(maxsize=self.pool_size)
+            pool = self._pool
+            try:
+                return pool.get_nowait()
+            except queue.Empty:
+                pass
+            # reserve a slot under the lock; the login itself runs outside
+            # so concurrent borrows do not serialize on the handshake
+            open_new = self._pool_connections < self.pool_size
+            if open_new:
+                self._pool_connections += 1
+        if open_new:
+            try:
+                connection = self.credentials.get_client(
+                    **connect_kwargs, **self._connect_params()
+                )
+            except Exception:
+                with self._pool_lock:
+                    self._pool_connections -= 1
+                raise
+            self.logger.info("Started a new pooled connection to Snowflake.")
+            return connection
+        try:
+            return pool.get(timeout=POOL_BORROW_TIMEOUT_SECONDS)
+        except queue.Empty:
+            raise RuntimeError(
+                "Could not borrow a connection from the pool within "
+                f"{POOL_BORROW_TIMEOUT_SECONDS} seconds; all {self.pool_size} "
+                "connections are in use. Consider increasing pool_size."
+            )
+
+    def _return_connection(self, connection: SnowflakeConnection) -> None:
+        """
+        Returns a borrowed connection to the pool; if the pool was closed
+        or filled in the meantime, the connection is closed instead of
+        blocking the caller.
+        """
+        pool = self._pool
+        if pool is None:
+            self._discard_connection(connection)
+            return
+        try:
+            pool.put_nowait(connection)
+        except queue.Full:
+            self._discard_connection(connection)
+
+    def _discard_connection(self, connection: SnowflakeConnection) -> None:
+        """
+        Drops a connection from the pool, e.g. after an error
+        left it in an unknown state.
+        """
+        with self._pool_lock:
+            self._pool_connections = max(0, self._pool_connections - 1)
+        try:
+            connection.close()
+        except Exception as exc:
+            self.logger.warning(f"Failed to close the discarded connection: {exc}")
+
+    @contextmanager
+    def _acquire_connection(self, **connect_kwargs: Dict[str, Any]):
+        """
+        Context manager that borrows an authenticated connection from the
+        block's pool and returns it upon exit, so repeated queries skip the
+        login handshake; if an exception is raised, the connection is
+        discarded instead, since it may be left in an unknown state.
+
+        Args:
+            **connect_kwargs: Additional arguments to pass to
+                `snowflake.connector.connect` when a new connection is opened.
+
+        Yields:
+            An authenticated SnowflakeConnection.
+        """
+        connection = self._borrow_connection(**connect_kwargs)
+        try:
+            yield connection
+        except Exception:
+            self._discard_connection(connection)
+            raise
+        else:
+            self._return_connection(connection)
+
+    @asynccontextmanager
+    async def session(self, **connect_kwargs: Dict[str, Any]):
+        """
+        Async context manager that borrows an authenticated connection from
+        the block's pool and returns it upon exit; the login for a fresh
+        connection runs in a worker thread so the event loop is not blocked.
+        If an exception is raised, the connection is discarded instead,
+        since it may be left in an unknown state.
+
+        Args:
+            **connect_kwargs: Additional arguments to pass to
+                `snowflake.connector.connect` when a new connection is opened.
+
+        Yields:
+            An authenticated SnowflakeConnection.
+
+        Examples:
+            Run a query over a pooled connection.
+            ```python
+            from prefect_snowflake.database import SnowflakeConnector
+
+            async def run_query():
+                snowflake_connector = await SnowflakeConnector.load("BLOCK_NAME")
+                async with snowflake_connector.session() as connection:
+                    with connection.cursor() as cursor:
+                        ...
+            ```
+        """
+        connection = await run_sync_in_worker_thread(
+            self._borrow_connection, **connect_kwargs
+        )
+        try:
+            yield connection
+        except Exception:
+            self._discard_connection(connection)
+            raise
+        else:
+            self._return_connection(connection)
+
+    def close_pool(self) -> None:
+        """
+        Closes all the connections kept in the block's pool.
+
+        Examples:
+            Close the pool after running pooled queries.
+            ```python
+            from prefect_snowflake.database import SnowflakeConnector
+
+            snowflake_connector = SnowflakeConnector.load("BLOCK_NAME")
+            try:
+                ...
+            finally:
+                snowflake_connector.close_pool()
+            ```
+        """
+        with self._pool_lock:
+            pool = self._pool
+            self._pool = None
+            self._pool_connections = 0
+        if pool is None:
+            return
+        while True:
+            try:
+                connection = pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                connection.close()
+            except Exception as exc:
+                self.logger.warning(f"Failed to close the pooled connection: {exc}")
+        self.logger.info("Successfully closed the connection pool.")
+
     def _start_connection(self):
         """
         Starts Snowflake database connection.
@@ -159,6 +515,8 @@ class SnowflakeConnector(DatabaseBlock):
         self.get_connection()
         if self._unique_cursors is None:
             self._unique_cursors = {}
+        if self._statement_cursors is None:
+            self._statement_cursors = {}
 
     def _get_cursor(
         self,
@@ -194,6 +552,90 @@ class SnowflakeConnector(DatabaseBlock):
             existing_cursor = self._unique_cursors[input_hash]
             return False, existing_cursor
 
+    @staticmethod
+    def _param_shape(
+        parameters: Union[Tuple[Any], Dict[str, Any], None]
+    ) -> Union[Tuple[str, ...], int, None]:
+        """
+        Describes the binding shape of the parameters, so cursors are only
+        shared between executions that bind the same way.
+        """
+        if isinstance(parameters, dict):
+            return tuple(sorted(parameters))
+        elif isinstance(parameters, (list, tuple)):
+            return len(parameters)
+        return None
+
+    def _get_statement_cursor(
+        self,
+        operation: str,
+        param_shape: Union[Tuple[str, ...], int, None],
+        cursor_type: Type[SnowflakeCursor] = SnowflakeCursor,
+    ) -> Tuple[SnowflakeCursor, threading.Lock]:
+        """
+        Get a Snowflake cursor reused across executions of the same
+        operation and parameter shape, preserving the driver's
+        prepared-statement state for repeated executes, along with the
+        lock serializing its use.
+
+        Args:
+            operation: The SQL query or other operation to be executed.
+            param_shape: The binding shape of the operation's parameters.
+            cursor_type: The class of the cursor to use when creating a
+                Snowflake cursor.
+
+        Returns:
+            A Snowflake cursor and its lock.
+        """
+        self._start_connection()
+
+        cursor_type_name = f"{cursor_type.__module__}.{cursor_type.__qualname__}"
+        input_hash = hash_objects((operation, param_shape, cursor_type_name))
+        if input_hash not in self._statement_cursors.keys():
+            self._statement_cursors[input_hash] = (
+                self._connection.cursor(cursor_type),
+                threading.Lock(),
+            )
+        return self._statement_cursors[input_hash]
+
+    async def _execute_on_statement_cursor(
+        self,
+        operation: str,
+        parameters: Union[Tuple[Any], Dict[str, Any], None],
+        cursor_type: Type[SnowflakeCursor],
+        method: str,
+        inputs: Dict[str, Any],
+    ) -> None:
+        """
+        Runs `cursor.execute`/`cursor.executemany` on the cached statement
+        cursor when it is free; if a concurrent call holds it mid-execute,
+        falls back to a throwaway cursor instead of interleaving statements
+        on a cursor, which the driver does not support.
+
+        Args:
+            operation: The SQL query or other operation to be executed.
+            parameters: The parameters for the operation.
+            cursor_type: The class of the cursor to use when creating a
+                Snowflake cursor.
+            method: The name of the cursor method to call.
+            inputs: The keyword arguments to pass to the cursor method.
+        """
+        cursor, cursor_lock = self._get_statement_cursor(
+            operation, self._param_shape(parameters), cursor_type
+        )
+        if cursor_lock.acquire(blocking=False):
+            try:
+                await run_sync_in_worker_thread(getattr(cursor, method), **inputs)
+            finally:
+                cursor_lock.release()
+            return
+
+        def _execute_on_new_cursor():
+            with self._connection.cursor(cursor_type) as new_cursor:
+                getattr(new_cursor, method)(**inputs)
+
+        await run_sync_in_worker_thread(_execute_on_new_cursor)
+
     async def _execute_async(self, cursor: SnowflakeCursor, inputs: Dict[str, Any]):
         """Helper method to execute operations asynchronously."""
         response = await run_sync_in_worker_thread(cursor.execute_async, **inputs)
@@ -203,12 +645,9 @@ class SnowflakeConnector(DatabaseBlock):
         )
 
         query_id = response["queryId"]
-        while self._connection.is_still_running(
-            await run_sync_in_worker_thread(
-                self._connection.get_query_status_throw_if_error, query_id
-            )
-        ):
-            await asyncio.sleep(self.poll_frequency_s)
+        await _wait_for_query_completion(
+            self._connection, cursor, query_id, self.poll_frequency_s
+        )
         await run_sync_in_worker_thread(cursor.get_results_from_sfqid, query_id)
 
     def reset_cursors(self) -> None:
@@ -237,13 +676,22 @@ class SnowflakeConnector(DatabaseBlock):
                 print(conn.fetch_one("SELECT * FROM customers"))  # should be Ford again
             ```
         """  # noqa
-        if not self._unique_cursors:
+        if not self._unique_cursors and not self._statement_cursors:
             self.logger.info("There were no cursors to reset.")
             return
 
-        input_hashes = tuple(self._unique_cursors.keys())
-        for input_hash in input_hashes:
-            cursor = self._unique_cursors.pop(input_hash)
+        cursors = dict(self._unique_cursors or {})
+        if self._statement_cursors:
+            cursors.update(
+                {
+                    input_hash: cursor
+                    for input_hash, (cursor, _) in self._statement_cursors.items()
+                }
+            )
+            self._statement_cursors.clear()
+        if self._unique_cursors:
+            self._unique_cursors.clear()
+        for input_hash, cursor in cursors.items():
             try:
                 cursor.close()
             except Exception as exc:
@@ -410,6 +858,9 @@ class SnowflakeConnector(DatabaseBlock):
         Returns:
             A list of tuples containing the data returned by the database,
                 where each row is a tuple and each column is a value in the tuple.
+                Note that every cell is decoded into a Python object, so for
+                large, numeric-heavy result sets, `fetch_arrow` and
+                `fetch_pandas` are much cheaper.
 
         Examples:
             Fetch all rows from the database where address is Highway 42.
@@ -448,6 +899,165 @@ class SnowflakeConnector(DatabaseBlock):
         result = await run_sync_in_worker_thread(cursor.fetchall)
         return result
 
+    @sync_compatible
+    async def fetch_arrow(
+        self,
+        operation: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        cursor_type: Type[SnowflakeCursor] = SnowflakeCursor,
+        **execute_kwargs: Dict[str, Any],
+    ) -> Any:
+        """
+        Fetch all results from the database as a PyArrow Table. The driver
+        hands over its Arrow result chunks directly instead of decoding
+        every cell into a Python object, which makes this the preferred
+        method for retrieving large, numeric-heavy result sets; requires
+        `pyarrow` to be installed.
+        Repeated calls using the same inputs to *any* of the fetch methods of this
+        block will skip executing the operation again, and instead,
+        return the next set of results from the previous execution,
+        until the reset_cursors method is called.
+
+        Args:
+            operation: The SQL query or other operation to be executed.
+            parameters: The parameters for the operation.
+            cursor_type: The class of the cursor to use when creating a Snowflake cursor.
+            **execute_kwargs: Additional options to pass to `cursor.execute_async`.
+
+        Returns:
+            A `pyarrow.Table` containing the data returned by the database.
+
+        Examples:
+            Fetch all rows from the database as an Arrow table.
+            ```python
+            from prefect_snowflake.database import SnowflakeConnector
+
+            with SnowflakeConnector.load("BLOCK_NAME") as conn:
+                table = conn.fetch_arrow("SELECT * FROM customers")
+            ```
+        """  # noqa
+        inputs = dict(
+            command=operation,
+            params=parameters,
+            **execute_kwargs,
+        )
+        new, cursor = self._get_cursor(inputs, cursor_type)
+        if new:
+            await self._execute_async(cursor, inputs)
+        self.logger.debug("Preparing to fetch all rows as an Arrow table.")
+        result = await run_sync_in_worker_thread(cursor.fetch_arrow_all)
+        return result
+
+    @sync_compatible
+    async def fetch_pandas(
+        self,
+        operation: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        cursor_type: Type[SnowflakeCursor] = SnowflakeCursor,
+        **execute_kwargs: Dict[str, Any],
+    ) -> Any:
+        """
+        Fetch all results from the database as a pandas DataFrame, decoded
+        through the driver's Arrow path rather than per-row Python tuples;
+        like `fetch_arrow`, prefer this method for retrieving large,
+        numeric-heavy result sets; requires `pandas` to be installed.
+        Repeated calls using the same inputs to *any* of the fetch methods of this
+        block will skip executing the operation again, and instead,
+        return the next set of results from the previous execution,
+        until the reset_cursors method is called.
+
+        Args:
+            operation: The SQL query or other operation to be executed.
+            parameters: The parameters for the operation.
+            cursor_type: The class of the cursor to use when creating a Snowflake cursor.
+            **execute_kwargs: Additional options to pass to `cursor.execute_async`.
+
+        Returns:
+            A `pandas.DataFrame` containing the data returned by the database.
+
+        Examples:
+            Fetch all rows from the database as a DataFrame.
+            ```python
+            from prefect_snowflake.database import SnowflakeConnector
+
+            with SnowflakeConnector.load("BLOCK_NAME") as conn:
+                df = conn.fetch_pandas("SELECT * FROM customers")
+            ```
+        """  # noqa
+        inputs = dict(
+            command=operation,
+            params=parameters,
+            **execute_kwargs,
+        )
+        new, cursor = self._get_cursor(inputs, cursor_type)
+        if new:
+            await self._execute_async(cursor, inputs)
+        self.logger.debug("Preparing to fetch all rows as a DataFrame.")
+        result = await run_sync_in_worker_thread(cursor.fetch_pandas_all)
+        return result
+
+    async def fetch_stream(
+        self,
+        operation: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        size: Optional[int] = None,
+        cursor_type: Type[SnowflakeCursor] = SnowflakeCursor,
+        **execute_kwargs: Dict[str, Any],
+    ) -> AsyncIterator[List[Tuple[Any]]]:
+        """
+        Fetch results from the database in batches, yielding each batch as
+        soon as it is retrieved. Unlike `fetch_all`, the full result set is
+        never materialized in memory at once, and consumption overlaps with
+        the download of the remaining result chunks; prefer this method for
+        result sets too large to hold comfortably in memory.
+        Repeated calls using the same inputs to *any* of the fetch methods of this
+        block will skip executing the operation again, and instead,
+        continue from the previous position,
+        until the reset_cursors method is called.
+
+        Args:
+            operation: The SQL query or other operation to be executed.
+            parameters: The parameters for the operation.
+            size: The number of rows to fetch per batch; if None or 0, uses
+                the value of `fetch_size` configured on the block.
+            cursor_type: The class of the cursor to use when creating a Snowflake cursor.
+            **execute_kwargs: Additional options to pass to `cursor.execute_async`.
+
+        Yields:
+            Batches of tuples containing the data returned by the database,
+                where each row is a tuple and each column is a value in the tuple.
+
+        Examples:
+            Stream rows from the database in batches of 10000.
+            ```python
+            from prefect_snowflake.database import SnowflakeConnector
+
+            async def process_customers():
+                conn = await SnowflakeConnector.load("BLOCK_NAME")
+                with conn:
+                    async for batch in conn.fetch_stream(
+                        "SELECT * FROM customers", size=10_000
+                    ):
+                        for row in batch:
+                            ...
+            ```
+        """  # noqa
+        inputs = dict(
+            command=operation,
+            params=parameters,
+            **execute_kwargs,
+        )
+        new, cursor = self._get_cursor(inputs, cursor_type)
+        if new:
+            await self._execute_async(cursor, inputs)
+        size = size or self.fetch_size
+        self.logger.debug(f"Preparing to stream rows in batches of {size}.")
+        while True:
+            batch = await run_sync_in_worker_thread(cursor.fetchmany, size=size)
+            if not batch:
+                break
+            yield batch
+
     @sync_compatible
     async def execute(
         self,
@@ -460,7 +1070,10 @@ class SnowflakeConnector(DatabaseBlock):
         Executes an operation on the database. This method is intended to be used
         for operations that do not return data, such as INSERT, UPDATE, or DELETE.
         Unlike the fetch methods, this method will always execute the operation
-        upon calling.
+        upon calling. The underlying cursor is reused across calls with the
+        same operation and parameter shape, so repeated executes keep the
+        driver's prepared-statement state; for bulk inserts of many
+        parameter sets, prefer `execute_many`.
 
         Args:
             operation: The SQL query or other operation to be executed.
@@ -479,15 +1092,14 @@ class SnowflakeConnector(DatabaseBlock):
                 )
             ```
         """  # noqa
-        self._start_connection()
-
         inputs = dict(
             command=operation,
             params=parameters,
             **execute_kwargs,
         )
-        with self._connection.cursor(cursor_type) as cursor:
-            await run_sync_in_worker_thread(cursor.execute, **inputs)
+        await self._execute_on_statement_cursor(
+            operation, parameters, cursor_type, "execute", inputs
+        )
         self.logger.info(f"Executed the operation, {operation!r}.")
 
     @sync_compatible
@@ -500,7 +1112,9 @@ class SnowflakeConnector(DatabaseBlock):
         Executes many operations on the database. This method is intended to be used
         for operations that do not return data, such as INSERT, UPDATE, or DELETE.
         Unlike the fetch methods, this method will always execute the operations
-        upon calling.
+        upon calling. This is the preferred entry point for repeated
+        statements, since the driver binds all the parameter sets in a
+        single API call instead of one call each.
 
         Args:
             operation: The SQL query or other operation to be executed.
@@ -525,14 +1139,14 @@ class SnowflakeConnector(DatabaseBlock):
                 )
             ```
         """  # noqa
-        self._start_connection()
-
         inputs = dict(
             command=operation,
             seqparams=seq_of_parameters,
         )
-        with self._connection.cursor() as cursor:
-            await run_sync_in_worker_thread(cursor.executemany, **inputs)
+        parameters = seq_of_parameters[0] if seq_of_parameters else None
+        await self._execute_on_statement_cursor(
+            operation, parameters, SnowflakeCursor, "executemany", inputs
+        )
         self.logger.info(
             f"Executed {len(seq_of_parameters)} operations off {operation!r}."
         )
@@ -544,6 +1158,7 @@ class SnowflakeConnector(DatabaseBlock):
         try:
             self.reset_cursors()
         finally:
+            self.close_pool()
             if self._connection is None:
                 self.logger.info("There was no connection open to be closed.")
                 return
@@ -566,7 +1181,18 @@ class SnowflakeConnector(DatabaseBlock):
     def __getstate__(self):
         """Allows block to be pickled and dumped."""
         data = self.__dict__.copy()
-        data.update({k: None for k in {"_connection", "_unique_cursors"}})
+        data.update(
+            {
+                k: None
+                for k in {
+                    "_connection",
+                    "_unique_cursors",
+                    "_statement_cursors",
+                    "_pool",
+                }
+            }
+        )
+        data["_pool_connections"] = 0
         return data
 
     def __setstate__(self, data: dict):
@@ -628,17 +1254,12 @@ async def snowflake_query(
         snowflake_query_flow()
         ```
     """
-    # context manager automatically rolls back failed transactions and closes
-    with snowflake_connector.get_connection() as connection:
+    # connection is returned to the connector's pool upon exit
+    async with snowflake_connector.session() as connection:
         with connection.cursor(cursor_type) as cursor:
-            response = cursor.execute_async(query, params=params)
-            query_id = response["queryId"]
-            while connection.is_still_running(
-                connection.get_query_status_throw_if_error(query_id)
-            ):
-                await asyncio.sleep(poll_frequency_seconds)
-            cursor.get_results_from_sfqid(query_id)
-            result = cursor.fetchall()
+            result = await _execute_and_fetch_all(
+                connection, cursor, query, params, poll_frequency_seconds
+            )
     return result
 
 
@@ -651,11 +1272,19 @@ async def snowflake_multiquery(
     as_transaction: bool = False,
     return_transaction_control_results: bool = False,
     poll_frequency_seconds: int = 1,
+    sequential: bool = False,
 ) -> List[List[Tuple[Any]]]:
     """
     Executes multiple queries against a Snowflake database in a shared session.
     Allows execution in a transaction.
 
+    Unless `as_transaction` or `sequential` is set, the queries are all
+    submitted up front and run concurrently server-side; results are
+    still returned in the order of the `queries` list, but the queries
+    must not depend on each other's effects. Set `as_transaction=True`
+    (or `sequential=True` to skip the transaction) for strictly ordered
+    execution, e.g. DDL followed by DML.
+
     Args:
         queries: The list of queries to execute against the database.
         params: The params to replace the placeholders in the query.
@@ -666,6 +1295,8 @@ async def snowflake_multiquery(
             controlling the transaction (BEGIN/COMMIT) should be returned.
         poll_frequency_seconds: Number of seconds to wait in between checks for
             run completion.
+        sequential: If True, each query is submitted only after the
+            previous one has completed, instead of concurrently.
 
     Returns:
         List of the outputs of `response.fetchall()` for each query.
@@ -702,23 +1333,47 @@ async def snowflake_multiquery(
         snowflake_multiquery_flow()
         ```
     """
-    with snowflake_connector.get_connection() as connection:
+    async with snowflake_connector.session() as connection:
         if as_transaction:
-            queries.insert(0, BEGIN_TRANSACTION_STATEMENT)
-            queries.append(END_TRANSACTION_STATEMENT)
+            # build a new list rather than mutating the caller's, which
+            # would corrupt the task's inputs on retries
+            queries = [
+                BEGIN_TRANSACTION_STATEMENT,
+                *queries,
+                END_TRANSACTION_STATEMENT,
+            ]
 
         with connection.cursor(cursor_type) as cursor:
             results = []
-            for query in queries:
-                response = cursor.execute_async(query, params=params)
-                query_id = response["queryId"]
-                while connection.is_still_running(
-                    connection.get_query_status_throw_if_error(query_id)
-                ):
-                    await asyncio.sleep(poll_frequency_seconds)
-                cursor.get_results_from_sfqid(query_id)
-                result = cursor.fetchall()
-                results.append(result)
+            if as_transaction or sequential:
+                # these queries must run one after the other so that
+                # BEGIN/COMMIT and the queries in between stay ordered;
+                # a plain execute returns with the results already bound,
+                # skipping the submit/poll/re-bind round-trips
+                for query in queries:
+                    await run_sync_in_worker_thread(
+                        cursor.execute, query, params=params
+                    )
+                    results.append(await run_sync_in_worker_thread(cursor.fetchall))
+            else:
+                # submit all the queries up front so they run concurrently,
+                # then wait on each in submission order; the later queries
+                # keep running server-side while the earlier ones are awaited
+                query_ids = []
+                for query in queries:
+                    response = await run_sync_in_worker_thread(
+                        cursor.execute_async, query, params=params
+                    )
+                    query_ids.append(response["queryId"])
+                for query_id in query_ids:
+                    await _wait_for_query_completion(
+                        connection, cursor, query_id, poll_frequency_seconds
+                    )
+                for query_id in query_ids:
+                    await run_sync_in_worker_thread(
+                        cursor.get_results_from_sfqid, query_id
+                    )
+                    results.append(await run_sync_in_worker_thread(cursor.fetchall))
 
     # cut off results from BEGIN/COMMIT queries
     if as_transaction and not return_transaction_control_results:
@@ -776,9 +1431,9 @@ async def snowflake_query_sync(
         snowflake_query_sync_flow()
         ```
     """
-    # context manager automatically rolls back failed transactions and closes
-    with snowflake_connector.get_connection() as connection:
+    # connection is returned to the connector's pool upon exit
+    async with snowflake_connector.session() as connection:
         with connection.cursor(cursor_type) as cursor:
-            cursor.execute(query, params=params)
-            result = cursor.fetchall()
+            await run_sync_in_worker_thread(cursor.execute, query, params=params)
+            result = await run_sync_in_worker_thread(cursor.fetchall)
     return result
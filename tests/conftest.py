@@ -132,9 +132,17 @@ def snowflake_connect_mock(monkeypatch):
     mock_cursor = MagicMock(name="cursor mock")
     results = iter([0, 1, 2, 3, 4])
     mock_cursor.return_value.fetchone.side_effect = lambda: (next(results),)
-    mock_cursor.return_value.fetchmany.side_effect = lambda size: list(
-        (next(results),) for i in range(size)
-    )
+
+    def fetchmany(size):
+        rows = []
+        for _ in range(size):
+            try:
+                rows.append((next(results),))
+            except StopIteration:
+                break
+        return rows
+
+    mock_cursor.return_value.fetchmany.side_effect = fetchmany
     mock_cursor.return_value.fetchall.side_effect = lambda: [
         (result,) for result in results
     ]
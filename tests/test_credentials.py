@@ -250,6 +250,45 @@ def test_get_client(credentials_params, snowflake_connect_mock: MagicMock):
     )
 
 
+def test_get_client_caches_connect_params(
+    credentials_params, snowflake_connect_mock: MagicMock
+):
+    snowflake_credentials = SnowflakeCredentials(**credentials_params)
+    snowflake_credentials.get_client()
+    resolved_connect_params = snowflake_credentials._resolved_connect_params
+    snowflake_credentials.get_client()
+    assert snowflake_credentials._resolved_connect_params is resolved_connect_params
+
+
+def test_get_client_cache_invalidated_upon_update(
+    credentials_params, snowflake_connect_mock: MagicMock
+):
+    snowflake_credentials = SnowflakeCredentials(**credentials_params)
+    snowflake_credentials.get_client()
+    snowflake_credentials.password = SecretStr("new_password")
+    snowflake_credentials.get_client()
+    snowflake_connect_mock.assert_called_with(
+        application="Prefect_Snowflake_Collection",
+        account="account",
+        user="user",
+        password="new_password",
+    )
+
+
+def test_resolved_connect_params_stay_out_of_serialization(
+    private_credentials_params, snowflake_connect_mock: MagicMock
+):
+    snowflake_credentials = SnowflakeCredentials(**private_credentials_params)
+    snowflake_credentials.get_client()
+    serialized = snowflake_credentials.json()
+    assert "letmein" not in serialized
+    assert "_resolved_connect_params" not in serialized
+    assert "_resolved_private_key" not in serialized
+    serialized_fields = snowflake_credentials.dict()
+    assert "_resolved_connect_params" not in serialized_fields
+    assert "_resolved_private_key" not in serialized_fields
+
+
 def test_get_client_okta_endpoint(
     credentials_params, snowflake_connect_mock: MagicMock
 ):
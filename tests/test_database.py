@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from unittest.mock import MagicMock
 
 import pytest
@@ -5,17 +6,52 @@ from prefect import flow
 from pydantic import SecretBytes, SecretStr
 from snowflake.connector import DictCursor
 from snowflake.connector.cursor import SnowflakeCursor as OriginalSnowflakeCursorClass
+from snowflake.connector.errors import ProgrammingError
 
 from prefect_snowflake.database import (
     BEGIN_TRANSACTION_STATEMENT,
     END_TRANSACTION_STATEMENT,
+    INITIAL_POLL_INTERVAL_SECONDS,
     SnowflakeConnector,
+    _backoff_intervals,
+    _wait_for_query_completion,
     snowflake_multiquery,
     snowflake_query,
     snowflake_query_sync,
 )
 
 
+async def test_wait_for_query_completion_uses_server_side_wait():
+    connection = MagicMock()
+    connection.is_still_running.side_effect = [True, False]
+    cursor = MagicMock()
+    await _wait_for_query_completion(connection, cursor, "1234", 1)
+    # one wait per loop iteration, each followed by a single status check
+    assert cursor.execute.call_count == 2
+    assert "SYSTEM$WAIT_FOR_QUERY_COMPLETION" in cursor.execute.call_args[0][0]
+    assert connection.get_query_status_throw_if_error.call_count == 2
+
+
+async def test_wait_for_query_completion_falls_back_to_polling():
+    connection = MagicMock()
+    connection.is_still_running.side_effect = [True, True, False]
+    cursor = MagicMock()
+    cursor.execute.side_effect = ProgrammingError(msg="Unknown function")
+    await _wait_for_query_completion(connection, cursor, "1234", 1)
+    # the server-side wait is not retried once it errors
+    cursor.execute.assert_called_once()
+    assert connection._server_side_wait_supported is False
+
+
+def test_backoff_intervals_backs_off_up_to_cap():
+    intervals = _backoff_intervals(2)
+    values = [next(intervals) for _ in range(20)]
+    assert values[0] <= INITIAL_POLL_INTERVAL_SECONDS * 1.1
+    assert all(value <= 2 * 1.1 for value in values)
+    # jitter aside, the intervals should grow towards the cap
+    assert values[-1] >= 2 * 0.9
+
+
 def test_snowflake_connector_init(connector_params):
     snowflake_connector = SnowflakeConnector(**connector_params)
     actual_connector_params = snowflake_connector.dict()
@@ -43,6 +79,9 @@ def test_snowflake_connector_private_key_is_secret(private_connector_params):
 
 
 class SnowflakeCursor:
+    def __init__(self):
+        self.result = {}
+
     def __enter__(self):
         return self
 
@@ -50,8 +89,8 @@ class SnowflakeCursor:
         return False
 
     def execute_async(self, query, params):
-        query_id = "1234"
-        self.result = {query_id: [(query, params)]}
+        query_id = str(len(self.result))
+        self.result[query_id] = [(query, params)]
         return {"queryId": query_id}
 
     def get_results_from_sfqid(self, query_id):
@@ -85,7 +124,14 @@ class SnowflakeConnection:
 @pytest.fixture()
 def snowflake_connector(snowflake_connect_mock):
     snowflake_connector_mock = MagicMock()
-    snowflake_connector_mock.get_connection.return_value = SnowflakeConnection()
+    connection = SnowflakeConnection()
+    snowflake_connector_mock.get_connection.return_value = connection
+
+    @asynccontextmanager
+    async def session():
+        yield connection
+
+    snowflake_connector_mock.session = session
     return snowflake_connector_mock
 
 
@@ -121,18 +167,39 @@ def test_snowflake_multiquery(snowflake_connector):
     assert result[1][0][1] == ("param",)
 
 
-def test_snowflake_multiquery_transaction(snowflake_connector):
+def test_snowflake_multiquery_sequential(snowflake_connector):
     @flow
     def test_flow():
         result = snowflake_multiquery(
             ["query1", "query2"],
             snowflake_connector,
             params=("param",),
+            sequential=True,
+        )
+        return result
+
+    result = test_flow()
+    # queries run through the ordered, plain-execute path
+    assert result[0][0] == ("query1", ("param",), "sync")
+    assert result[1][0] == ("query2", ("param",), "sync")
+
+
+def test_snowflake_multiquery_transaction(snowflake_connector):
+    queries = ["query1", "query2"]
+
+    @flow
+    def test_flow():
+        result = snowflake_multiquery(
+            queries,
+            snowflake_connector,
+            params=("param",),
             as_transaction=True,
         )
         return result
 
     result = test_flow()
+    # the caller's list is not mutated with BEGIN/COMMIT statements
+    assert queries == ["query1", "query2"]
     assert result[0][0][0] == "query1"
     assert result[0][0][1] == ("param",)
     assert result[1][0][0] == "query2"
@@ -202,6 +269,30 @@ class TestSnowflakeConnector:
         assert snowflake_connector._connection is connection
         assert caplog.records[0].msg == "Started a new connection to Snowflake."
 
+    def test_get_connection_with_session_parameters(
+        self, connector_params, snowflake_connect_mock
+    ):
+        snowflake_connector = SnowflakeConnector(
+            **connector_params,
+            query_tag="my-flow",
+            session_parameters={"TIMEZONE": "UTC"},
+        )
+        snowflake_connector.get_connection()
+        _, kwargs = snowflake_connect_mock.call_args
+        assert kwargs["session_parameters"] == {
+            "TIMEZONE": "UTC",
+            "QUERY_TAG": "my-flow",
+        }
+
+    def test_get_connection_with_numpy_decoding(
+        self, connector_params, snowflake_connect_mock
+    ):
+        snowflake_connector = SnowflakeConnector(**connector_params, use_numpy=True)
+        snowflake_connector.get_connection()
+        _, kwargs = snowflake_connect_mock.call_args
+        assert kwargs["numpy"] is True
+        assert "arrow_number_to_decimal" not in kwargs
+
     def test_reset_cursors(self, snowflake_connector: SnowflakeConnector, caplog):
         mock_cursor = MagicMock()
         snowflake_connector.reset_cursors()
@@ -261,15 +352,109 @@ class TestSnowflakeConnector:
         result = snowflake_connector.fetch_all("query", parameters=("param",))
         assert result == [(0,), (1,), (2,), (3,), (4,)]
 
+    def test_fetch_arrow(self, snowflake_connector: SnowflakeConnector):
+        result = snowflake_connector.fetch_arrow("query", parameters=("param",))
+        cursor = snowflake_connector._connection.cursor.return_value
+        cursor.fetch_arrow_all.assert_called_once()
+        assert result is cursor.fetch_arrow_all.return_value
+
+    def test_fetch_pandas(self, snowflake_connector: SnowflakeConnector):
+        result = snowflake_connector.fetch_pandas("query", parameters=("param",))
+        cursor = snowflake_connector._connection.cursor.return_value
+        cursor.fetch_pandas_all.assert_called_once()
+        assert result is cursor.fetch_pandas_all.return_value
+
+    async def test_fetch_stream(self, snowflake_connector: SnowflakeConnector):
+        batches = [
+            batch
+            async for batch in snowflake_connector.fetch_stream(
+                "query", parameters=("param",), size=2
+            )
+        ]
+        assert batches == [[(0,), (1,)], [(2,), (3,)], [(4,)]]
+
     def test_execute(self, snowflake_connector: SnowflakeConnector):
         assert snowflake_connector.execute("query", parameters=("param",)) is None
 
+    def test_execute_reuses_statement_cursor(
+        self, snowflake_connector: SnowflakeConnector
+    ):
+        snowflake_connector.execute("query", parameters={"a": 1})
+        snowflake_connector.execute("query", parameters={"a": 2})
+        assert snowflake_connector._connection.cursor.call_count == 1
+        snowflake_connector.execute("query", parameters={"a": 1, "b": 2})
+        assert snowflake_connector._connection.cursor.call_count == 2
+
+    def test_execute_falls_back_when_statement_cursor_busy(
+        self, snowflake_connector: SnowflakeConnector
+    ):
+        snowflake_connector.execute("query", parameters={"a": 1})
+        assert snowflake_connector._connection.cursor.call_count == 1
+        _, cursor_lock = next(iter(snowflake_connector._statement_cursors.values()))
+        with cursor_lock:
+            # a concurrent call holds the cached cursor; a throwaway is used
+            snowflake_connector.execute("query", parameters={"a": 2})
+        assert snowflake_connector._connection.cursor.call_count == 2
+        # once released, the cached cursor is reused again
+        snowflake_connector.execute("query", parameters={"a": 3})
+        assert snowflake_connector._connection.cursor.call_count == 2
+
     def test_execute_Many(self, snowflake_connector: SnowflakeConnector):
         assert (
             snowflake_connector.execute_many("query", seq_of_parameters=[("param",)])
             is None
         )
 
+    def test_acquire_connection_reuses_pooled_connection(
+        self, snowflake_connector: SnowflakeConnector, snowflake_connect_mock
+    ):
+        with snowflake_connector._acquire_connection():
+            pass
+        with snowflake_connector._acquire_connection():
+            pass
+        assert snowflake_connect_mock.call_count == 1
+
+    def test_acquire_connection_discards_connection_on_error(
+        self, snowflake_connector: SnowflakeConnector, snowflake_connect_mock
+    ):
+        with pytest.raises(RuntimeError, match="oh no"):
+            with snowflake_connector._acquire_connection():
+                raise RuntimeError("oh no")
+        with snowflake_connector._acquire_connection():
+            pass
+        assert snowflake_connect_mock.call_count == 2
+
+    async def test_session_reuses_pooled_connection(
+        self, snowflake_connector: SnowflakeConnector, snowflake_connect_mock
+    ):
+        async with snowflake_connector.session():
+            pass
+        async with snowflake_connector.session():
+            pass
+        assert snowflake_connect_mock.call_count == 1
+
+    def test_close_pool(
+        self, snowflake_connector: SnowflakeConnector, snowflake_connect_mock, caplog
+    ):
+        with snowflake_connector._acquire_connection() as connection:
+            pass
+        snowflake_connector.close_pool()
+        connection.close.assert_called_once()
+        assert snowflake_connector._pool is None
+        assert any(
+            record.msg == "Successfully closed the connection pool."
+            for record in caplog.records
+        )
+
+    def test_close_pool_while_connection_borrowed(
+        self, snowflake_connector: SnowflakeConnector, snowflake_connect_mock
+    ):
+        with snowflake_connector._acquire_connection() as connection:
+            snowflake_connector.close_pool()
+        # the late return does not raise; the connection is closed instead
+        connection.close.assert_called_once()
+        assert snowflake_connector._pool is None
+
     def test_close(self, snowflake_connector: SnowflakeConnector, caplog):
         assert snowflake_connector.close() is None
         assert caplog.records[0].msg == "There were no cursors to reset."